@@ -13,6 +13,7 @@ if sys.platform == "win32":
         run_clean_subprocess,
         set_aot,
         set_position,
+        set_rect,
         set_size,
         set_window_frame,
     )
@@ -28,6 +29,7 @@ else:
         run_clean_subprocess,
         set_aot,
         set_position,
+        set_rect,
         set_size,
         set_window_frame,
     )
@@ -36,7 +38,9 @@ from backend.common import (
     WindowInfo,
     WindowMetrics,
     WindowsWindow,
+    asset_name,
     clean_window_title,
+    config_metrics_snapshot,
     config_to_metrics,
     convert_hex_to_rgb,
     format_coords,
@@ -59,8 +63,10 @@ __all__ = [
     "WindowManager",
     "WindowMetrics",
     "WindowsWindow",
+    "asset_name",
     "bring_to_front",
     "clean_window_title",
+    "config_metrics_snapshot",
     "config_to_metrics",
     "convert_hex_to_rgb",
     "format_coords",
@@ -80,6 +86,7 @@ __all__ = [
     "run_clean_subprocess",
     "set_aot",
     "set_position",
+    "set_rect",
     "set_size",
     "set_window_frame",
     "set_window_frame",
@@ -4,8 +4,10 @@ import re
 import sys
 from configparser import ConfigParser
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+import psutil
 import roman
 
 logger = logging.getLogger(__name__)
@@ -13,7 +15,14 @@ logger = logging.getLogger(__name__)
 # noinspection SpellCheckingInspection
 base_path = getattr(sys, "_MEIPASS", Path(Path(__file__).absolute().parent.parent))
 
-@dataclass
+_INT_PAIR_PATTERN = re.compile(r"^\s*([+-]?\d+)\s*,\s*([+-]?\d+)\s*$")
+_TITLE_SEPARATOR_PATTERN = re.compile(r" [-—–] ")  # noqa: RUF001
+_TITLE_PERCENT_PATTERN = re.compile(r"\s+\d+%$")
+_TITLE_INVALID_CHARS_PATTERN = re.compile(r'[<>:"/\\|?*\[\]]')
+TITLE_VERSION_PATTERN = re.compile(r"(.+)v\d+", re.IGNORECASE)
+_ASSET_NAME_TABLE = str.maketrans({" ": "_", ":": None})
+
+@dataclass(slots=True)
 class WindowMetrics:
     """Hold metrics data for a window or config."""
 
@@ -25,8 +34,12 @@ class WindowMetrics:
     border: bool
     apply_order: str
 
+    def placement(self) -> tuple[int, int, int, int, bool, bool]:
+        """Get the compared fields (everything except apply_order) as a tuple."""
+        return self.x, self.y, self.w, self.h, self.aot, self.border
+
 
-@dataclass
+@dataclass(slots=True)
 class WindowInfo:
     """Hold information about application windows."""
 
@@ -39,7 +52,7 @@ class WindowInfo:
     exists: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowsWindow:
     """Hold information about application windows."""
 
@@ -85,6 +98,11 @@ def window_to_metrics(window: WindowsWindow | None)->WindowMetrics | None:
     )
 
 
+def asset_name(title: str) -> str:
+    """Get the screenshot file name base for a window title."""
+    return title.translate(_ASSET_NAME_TABLE)
+
+
 def get_data_path(relative_path: str)->str:
     """Get the absolute path to a data file."""
     absolute_path = Path(base_path) / "data" / relative_path
@@ -99,19 +117,25 @@ def get_binary_path(relative_path: str) -> str:
 
 def clean_window_title(title:str, exe:str="", *, titlecase:bool=True)->list:
     """Remove special characters from title."""
+    return list(_clean_window_title(title, exe, titlecase=titlecase))
+
+
+@lru_cache(maxsize=1024)
+def _clean_window_title(title:str, exe:str, *, titlecase:bool)->tuple[str, str]:
+    """Clean a title once per distinct input, the result is shared so it is immutable."""
     if not title:
-        return ["",""]
+        return "", ""
 
-    parts = re.split(r" [-—–] ", title)  # noqa: RUF001
+    parts = _TITLE_SEPARATOR_PATTERN.split(title)
     title = parts[-1].strip()
 
-    title = re.sub(r"\s+\d+%$", "", title)
-    title = re.sub(r'[<>:"/\\|?*\[\]]', "", title.lower())
+    title = _TITLE_PERCENT_PATTERN.sub("", title)
+    title = _TITLE_INVALID_CHARS_PATTERN.sub("", title.lower())
 
     title = uppercase_roman_numerals(title.title()) if titlecase else uppercase_roman_numerals(title)
     if exe:
-        return [title, exe.split(".")[0]]
-    return  [title, title]
+        return title, exe.split(".")[0]
+    return title, title
 
 
 def convert_rgb_to_hex(r:int, g:int, b:int)->str:
@@ -119,6 +143,7 @@ def convert_rgb_to_hex(r:int, g:int, b:int)->str:
     return f"#{r:02X}{g:02X}{b:02X}"
 
 
+@lru_cache(maxsize=128)
 def invert_hex_color(hex_color:str)->str:
     """Calculate the inverse of the given color."""
     r, g, b = convert_hex_to_rgb(hex_color)
@@ -155,6 +180,29 @@ def uppercase_roman_numerals(text:str)->str:
     return " ".join(sections)
 
 
+@lru_cache(maxsize=256)
+def _section_pattern(section: str) -> re.Pattern:
+    """Compile the prefix pattern for a section name once."""
+    return re.compile(r"^" + re.escape(section) + r"(\b|$)")
+
+
+def _index_sections(sections: list) -> tuple[dict[str, list], list]:
+    """Group sections and their patterns by first character.
+
+    Matches are anchored at the start, so only sections sharing a title's first character can match it.
+    Empty section names have no first character and are added to every group.
+    Return the groups and the list of empty sections, used for titles without a group.
+    """
+    sections_by_initial = {}
+    for section in sections:
+        sections_by_initial.setdefault(section[:1], []).append((section, _section_pattern(section)))
+    match_any = sections_by_initial.pop("", [])
+    if match_any:
+        for candidates in sections_by_initial.values():
+            candidates.extend(match_any)
+    return sections_by_initial, match_any
+
+
 def match_titles(sections: list, titles: list, *, get_titles: bool = False) -> bool | dict:
     """Compare two lists for matching titles.
 
@@ -164,12 +212,14 @@ def match_titles(sections: list, titles: list, *, get_titles: bool = False) -> b
     if not sections or not titles:
         return {} if get_titles else False
 
+    sections_by_initial, match_any = _index_sections(sections)
+
     title_matches = {}
     for title in titles:
         if not title.strip():
             continue
 
-        for section in sections:
+        for section, pattern in sections_by_initial.get(title[0], match_any):
             # Exact match
             if section == title:
                 if get_titles:
@@ -178,8 +228,7 @@ def match_titles(sections: list, titles: list, *, get_titles: bool = False) -> b
                     return True
 
             # Prefix match that ensures a word boundary or the end follows the section
-            pattern = r"^" + re.escape(section) + r"(\b|$)"
-            if bool(re.match(pattern, title)):
+            if pattern.match(title):
                 if get_titles:
                     if section not in title_matches:  # Avoid overwriting an exact match
                         title_matches[section] = title
@@ -200,15 +249,23 @@ def to_bool(*, val: str | bool) -> bool:
 
 def validate_int_pair(value: str, default: tuple[int, int] = (0, 0)) -> tuple[int, int]:
     """Check if int pair is valid."""
-    try:
-        x, y = map(int, value.split(","))
-    except ValueError:
+    match = _INT_PAIR_PATTERN.match(value or "")
+    if not match:
         return default
-    else:
-        return x, y
+    return int(match.group(1)), int(match.group(2))
+
 
+@lru_cache(maxsize=256)
+def process_details(proc: psutil.Process) -> tuple[str, str]:
+    """Get the executable name and path of a process.
 
-def parse_coords(value: str, default: tuple[int, int] = (0, 0)) -> tuple[int, int]:
+    Processes hash by pid and creation time, so a reused pid never hits a stale entry.
+    """
+    return proc.name(), proc.exe()
+
+
+@lru_cache(maxsize=256)
+def parse_coords(value: str, default: tuple[int, int] | None = (0, 0)) -> tuple[int, int] | None:
     """Parse a string of the format 'x,y' into a tuple of integers."""
     try:
         parts = value.split(",")
@@ -224,12 +281,19 @@ def format_coords(x: int, y: int) -> str:
 
 def config_to_metrics(config: ConfigParser, section: str) -> WindowMetrics:
     """Convert a config section to WindowMetrics."""
-    x, y = parse_coords(config.get(section, "position", fallback="0,0"))
-    w, h = parse_coords(config.get(section, "size", fallback="0,0"))
+    x, y = parse_coords(config.get(section, "position"))
+    w, h = parse_coords(config.get(section, "size"))
     return WindowMetrics(x, y, w, h,
-                         config.getboolean(section, "always_on_top", fallback=False),
-                         config.getboolean(section, "titlebar", fallback=True),
+                         config.getboolean(section, "always_on_top"),
+                         config.getboolean(section, "titlebar"),
                          config.get(section, "apply_order", fallback=""),
                          )
 
 
+def config_metrics_snapshot(config: ConfigParser | None) -> dict[str, WindowMetrics]:
+    """Parse every config section into WindowMetrics once, keyed by section name."""
+    if not config:
+        return {}
+    return {section: config_to_metrics(config, section) for section in config.sections()}
+
+
@@ -8,6 +8,7 @@ import os
 import re
 from configparser import ConfigParser
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 # Local imports
@@ -38,15 +39,19 @@ class ApplicationSettings:
     ignored_windows: list = field(default_factory=lambda: IGNORED_WINDOWS.copy())
 
 
+@lru_cache(maxsize=64)
+def _split_ignore_list(value: str) -> tuple[str, ...]:
+    """Split a comma separated ignore list into stripped, non-empty titles."""
+    return tuple(title for title in (part.strip() for part in value.split(",")) if title)
+
+
 def get_ignore_list(config: ConfigParser) -> list[str]:
     """Get the ignore list from the config."""
     if not config:
         return []
 
-    for title in config.sections():
-        if config[title].get("ignore_list"):
-            return config[title].get("ignore_list").split(",")
-    return []
+    # The ignore list is saved in DEFAULT and inherited by every section
+    return list(_split_ignore_list(config.defaults().get("ignore_list", "")))
 
 
 def safe_eval_layout_value(value: str) -> dict | list | tuple | None:
@@ -75,8 +80,35 @@ def safe_eval_layout_value(value: str) -> dict | list | tuple | None:
     return evaluated
 
 
+# Every window section carries these keys, so config_to_metrics reads them without fallbacks
+SECTION_DEFAULTS = {
+    "position": "0,0",
+    "size": "800,600",
+    "always_on_top": "false",
+    "titlebar": "true",
+}
+
+
+def _repair_value(section: str, key: str, value: str) -> str:
+    """Return a valid string for a single window setting, falling back to its default."""
+    if key in ("position", "size"):
+        coords = parse_coords(value, default=None)
+        if coords is not None:
+            return format_coords(*coords)
+    elif key in ("always_on_top", "titlebar", "process_priority"):
+        flag = str(value).lower()
+        if flag in ("true", "false"):
+            return flag
+    else:
+        return value.strip()
+
+    default = SECTION_DEFAULTS.get(key, "false")
+    logger.warning("Invalid value for [%s].%s: %r, using %s", section, key, value, default)
+    return default
+
+
 def validate_and_repair_config(config: ConfigParser) -> ConfigParser:
-    """Validate and repair a configuration file."""
+    """Validate and repair a configuration file, filling in missing window settings with defaults."""
     repaired_config = ConfigParser()
     repaired_config.optionxform = str
 
@@ -84,16 +116,12 @@ def validate_and_repair_config(config: ConfigParser) -> ConfigParser:
         if not section.strip():
             continue
 
-        valid_items = {}
-        for key, value in config.items(section):
-            if key in ("position", "size"):
-                d_val = (0, 0) if key == "position" else (800, 600)
-                coords = parse_coords(value, default=d_val)
-                valid_items[key] = format_coords(*coords)
-            elif key in ("always_on_top", "titlebar", "process_priority"):
-                valid_items[key] = str(value).lower() if str(value).lower() in ("true", "false") else "false"
-            else:
-                valid_items[key] = value.strip()
+        valid_items = {key: _repair_value(section, key, value) for key, value in config.items(section)}
+
+        for key, default in SECTION_DEFAULTS.items():
+            if key not in valid_items:
+                logger.warning("Missing [%s].%s, using %s", section, key, default)
+                valid_items[key] = default
 
         if valid_items:
             repaired_config.add_section(section)
@@ -119,6 +147,9 @@ class ConfigManager:
         self.settings_dir = Path(self.base_path, "settings")
         self.settings_file = Path(self.settings_dir, "settings.json")
         self.default_layouts = DEFAULT_LAYOUTS
+        # Only used from the GUI thread, workers receive configs and metrics that are already loaded
+        self._config_cache: dict[Path, tuple[int, ConfigParser]] = {}
+        self._list_cache: tuple[int, dict] | None = None
 
         # Create directories if they don't exist
         if not Path.exists(self.config_dir):
@@ -133,22 +164,38 @@ class ConfigManager:
 
 
     def list_config_files(self)->dict:
-        """List all configuration files and their names."""
+        """List all configuration files and their names, rescanning only when the folder changed."""
+        dir_mtime_ns = self.config_dir.stat().st_mtime_ns
+        if self._list_cache and self._list_cache[0] == dir_mtime_ns:
+            return dict(self._list_cache[1])
+
         config_files = [f for f in self.config_dir.iterdir()
                         if f.is_file() and f.name.startswith("config_") and f.name.endswith(".ini")]
         config_files.sort()
-        config_names = [f.name.replace("config_", "").replace(".ini","") for f in config_files]
-        return dict(zip(config_names, config_files, strict=False))
+        # removeprefix is the exact inverse of the f"config_{name}.ini" naming used when saving
+        listing = {f.stem.removeprefix("config_"): f for f in config_files}
+        self._list_cache = (dir_mtime_ns, listing)
+        return dict(listing)
 
 
     def load_config(self, config_path:str)-> ConfigParser | None:
-        """Load a configuration file."""
-        config = ConfigParser()
+        """Load a configuration file, reusing the parsed result while the file is unchanged."""
         full_path = Path(self.config_dir, config_path)
-        if Path.exists(full_path):
-            config.read(full_path)
-            return validate_and_repair_config(config)
-        return None
+        try:
+            mtime_ns = full_path.stat().st_mtime_ns
+        except OSError:
+            self._config_cache.pop(full_path, None)
+            return None
+
+        cached = self._config_cache.get(full_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        config = ConfigParser()
+        config.read(full_path)
+        config = validate_and_repair_config(config)
+        self._config_cache[full_path] = (mtime_ns, config)
+        return config
 
 
     def load_settings(self)-> ApplicationSettings:
@@ -314,6 +361,9 @@ class ConfigManager:
                 os.fsync(f.fileno())
         except OSError:
             return False
+        finally:
+            self._config_cache.pop(config_path, None)
+            self._list_cache = None
 
         return True
 
@@ -321,6 +371,8 @@ class ConfigManager:
     def delete_config(self, name:str)->bool:
         """Delete a config file."""
         path = Path(self.config_dir, f"config_{name}.ini")
+        self._config_cache.pop(path, None)
+        self._list_cache = None
         if Path.exists(path):
             try:
                 Path.unlink(path)
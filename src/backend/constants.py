@@ -1,4 +1,7 @@
 """Constant classes for Ultrawide Window Positioner."""
+from __future__ import annotations
+
+from backend.common import invert_hex_color
 
 AOT_HOTKEY = "alt+home"
 
@@ -12,6 +15,32 @@ IGNORED_WINDOWS = [
     "windows shell experience host",
 ]
 
+# Screenshot assets are saved as "<name>_<suffix>.png", the suffix names the closest aspect ratio
+ASSET_RATIOS = {
+    "32-9": 32/9,
+    "21-9": 21/9,
+    "16-9": 16/9,
+    "4-3": 4/3,
+    "square": 1,
+    "3-4": 3/4,
+    "9-16": 9/16,
+    "9-21": 9/21,
+    "9-32": 9/32,
+}
+
+# Lower ratio bound for each suffix, checked in order when saving a capture
+ASSET_RATIO_SUFFIXES = (
+    (3.0, "32-9"),
+    (2.0, "21-9"),
+    (1.5, "16-9"),
+    (1.2, "4-3"),
+    (0.85, "square"),
+    (0.65, "3-4"),
+    (0.5, "9-16"),
+    (0.35, "9-21"),
+    (0.28, "9-32"),
+)
+
 
 class LayoutDefaults:
     """Default layouts."""
@@ -209,6 +238,19 @@ class Colors:
     BUTTON_NOTICE = "#907000"
     BUTTON_DISABLED = "#2A2A2A"
 
+    _inverted = None
+
+    @classmethod
+    def inverted(cls) -> Colors:
+        """Get a shared instance with all colors inverted, used for the light theme."""
+        if cls._inverted is None:
+            inverted = cls()
+            for attr, value in vars(cls).items():
+                if attr.isupper() and isinstance(value, str):
+                    setattr(inverted, attr, invert_hex_color(value))
+            cls._inverted = inverted
+        return cls._inverted
+
 class Messages:
     """GUI messages."""
 
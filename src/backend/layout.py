@@ -0,0 +1,130 @@
+"""Auto-align layout calculations."""
+from collections.abc import Callable
+from dataclasses import dataclass
+from fractions import Fraction
+from functools import lru_cache
+
+Position = tuple[int | Fraction, int | Fraction, int | Fraction, int | Fraction]
+
+
+@dataclass(frozen=True, slots=True)
+class ScreenArea:
+    """Hold the screen geometry a layout is fitted into."""
+
+    width: int
+    height: int
+    usable_height: int
+    y_offset: int
+
+
+@lru_cache(maxsize=64)
+def layout_ratio(numerator: int, denominator: int) -> Fraction:
+    """Get a layout aspect ratio as an exact fraction."""
+    return Fraction(numerator, denominator)
+
+
+@lru_cache(maxsize=64)
+def layout_weight(value: str | int) -> Fraction:
+    """Get a layout weight such as '2/3' as an exact fraction."""
+    return Fraction(value)
+
+
+def calc_four(layout: list, area: ScreenArea) -> list[Position]:
+    """Get positions for a four window layout of relative coordinates."""
+    screen_width, usable_height, y_offset = area.width, area.usable_height, area.y_offset
+    positions = []
+    for (rel_x, rel_y), (rel_w, rel_h) in layout:
+        raw_x = int(rel_x * screen_width)
+        raw_y = int(rel_y * usable_height) + y_offset
+        raw_w = int(rel_w * screen_width)
+        raw_h = int(rel_h * usable_height)
+        positions.append((raw_x, raw_y, raw_w, raw_h))
+    return positions
+
+
+def calc_three(layout: list, area: ScreenArea) -> list[Position]:
+    """Get positions for a three window layout with a centered main window."""
+    screen_width, screen_height = area.width, area.height
+    usable_height, y_offset = area.usable_height, area.y_offset
+    numerator, denominator, weight_1 = layout
+    weight_1 = layout_weight(weight_1)
+    if not (0 <= weight_1 <= 1):
+        weight_1 = Fraction(1, 2)
+
+    weight_2 = 1 - weight_1
+    ratio = layout_ratio(numerator, denominator)
+
+    aux_width = screen_width - (screen_height * ratio)
+    left_width = aux_width * weight_1
+    center_width = screen_height * ratio
+    right_width = aux_width * weight_2
+
+    return [
+        (0, y_offset, left_width, usable_height),
+        (left_width, y_offset, center_width, screen_height),
+        (left_width + center_width, y_offset, right_width, usable_height),
+    ]
+
+
+def calc_two(layout: list, area: ScreenArea) -> list[Position]:
+    """Get positions for a two window layout."""
+    screen_width, screen_height = area.width, area.height
+    usable_height, y_offset = area.usable_height, area.y_offset
+    numerator, denominator, side = layout
+    side_width = screen_height * layout_ratio(numerator, denominator)
+
+    heights = {
+        "R": (screen_height, screen_height),
+        "L": (screen_height, screen_height),
+        "CL": (usable_height, screen_height),
+        "CR": (screen_height, usable_height),
+    }
+    if side not in heights:
+        side_width = 0
+    left_height, right_height = heights.get(side, (0, 0))
+
+    if side in ("R", "CL"):
+        right_width = side_width
+        left_width = (screen_width - right_width) / (2 if side == "CL" else 1)
+        left_x = 0
+    else:
+        left_width = side_width
+        right_width = (screen_width - left_width) / (2 if side == "CR" else 1)
+        left_x = right_width if side == "CR" else 0
+
+    right_x = left_x + left_width
+    return [
+        (int(left_x), y_offset, int(left_width), int(left_height)),
+        (int(right_x), y_offset, int(right_width), int(right_height)),
+    ]
+
+
+def calc_one(layout: list, area: ScreenArea) -> list[Position]:
+    """Get the position for a single window layout."""
+    screen_width, screen_height, y_offset = area.width, area.height, area.y_offset
+    numerator, denominator, side = layout
+    window_width = screen_height * layout_ratio(numerator, denominator)
+
+    raw_x = 0
+    if side == "R":
+        raw_x = screen_width - window_width
+    elif side == "C":
+        raw_x = (screen_width / 2) - (window_width / 2)
+
+    return [(int(raw_x), y_offset, int(window_width), int(screen_height))]
+
+
+POSITION_CALCULATORS: dict[int, Callable[..., list[Position]]] = {
+    1: calc_one,
+    2: calc_two,
+    3: calc_three,
+    4: calc_four,
+}
+
+
+def compute_positions(num_windows: int, layout: list, area: ScreenArea) -> list[Position] | None:
+    """Get raw window positions for a layout, or None if no calculator exists for the window count."""
+    calculator = POSITION_CALCULATORS.get(num_windows)
+    if calculator is None:
+        return None
+    return calculator(layout, area)
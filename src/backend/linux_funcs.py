@@ -2,7 +2,6 @@
 
 import logging
 import os
-import re
 import subprocess
 import time
 from collections.abc import Callable
@@ -11,11 +10,25 @@ from pathlib import Path
 
 import psutil
 
-from backend.common import WindowsWindow, clean_window_title, get_binary_path
+from backend.common import (
+    TITLE_VERSION_PATTERN,
+    WindowsWindow,
+    clean_window_title,
+    get_binary_path,
+    process_details,
+)
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Main window id of this application, kept while it still carries the application title
+_own_window_id: str | None = None
+
+# Upper bounds in seconds for helper processes, a stalled KWin call must not block the reapply loop
+KDOTOOL_TIMEOUT = 2
+QDBUS_TIMEOUT = 2
+SPECTACLE_TIMEOUT = 10
+
+@dataclass(slots=True)
 class KWinWindow:  # noqa: D101
     uuid: str
     caption: str
@@ -37,9 +50,7 @@ class KWinWindow:  # noqa: D101
 
 def _kwin_windows_window(window: KWinWindow, pid: int) -> WindowsWindow:
     """Convert KWinWindow to WindowsWindow."""
-    proc = psutil.Process(pid)
-    app_name = proc.name()
-    app_path = proc.exe()
+    app_name, app_path = process_details(psutil.Process(pid))
     return WindowsWindow(
         window.uuid,
         pid,
@@ -68,10 +79,13 @@ def _run_kdotool(cmd: list, win_id: str = "", *args: str) -> str | bool:
     retries = 5
     while retries > 0:
         try:
-            return run_clean_subprocess(command, check_output=True).decode().strip()
+            return run_clean_subprocess(command, check_output=True, timeout=KDOTOOL_TIMEOUT).decode().strip()
         except FileNotFoundError as e:
             logger.info("kdotool not found: %s", e)
             return False
+        except subprocess.TimeoutExpired as e:
+            logger.info("kdotool timed out: %s", e)
+            return False
         except subprocess.CalledProcessError as e:
             logger.info("kdotool subprocess error: %s", e)
             time.sleep(0.2)
@@ -133,7 +147,7 @@ def _validate_win_id(func: Callable) -> Callable[..., bool]:
 def run_clean_subprocess(command: list[str],
                          *,
                          check_output: bool = False,
-                         **kwargs: str | bool,
+                         **kwargs: str | bool | float,
                          ) -> subprocess.CompletedProcess | bytes:
     """Run subprocess with local env."""
     env = dict(os.environ)
@@ -154,9 +168,9 @@ def get_screenshot(win_id: str, path: Path) -> None:
     """Take a screenshot of the window."""
     _run_kdotool(["windowactivate"], win_id)
     try:
-        run_clean_subprocess(["spectacle", "-w", "-a", "-b", "-n", "-o", path])
+        run_clean_subprocess(["spectacle", "-w", "-a", "-b", "-n", "-o", path], timeout=SPECTACLE_TIMEOUT)
 
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
         logger.info("Spectacle failed: %s", e)
 
 
@@ -174,7 +188,11 @@ def get_window_info(win_id: str) -> WindowsWindow | None:
     """Get information about a window."""
     clean_uuid = win_id.strip("{}").lower()
     info_cmd = ["qdbus-qt6", "org.kde.KWin", "/KWin", "org.kde.KWin.getWindowInfo", clean_uuid]
-    win_info = run_clean_subprocess(info_cmd, check_output=True)
+    try:
+        win_info = run_clean_subprocess(info_cmd, check_output=True, timeout=QDBUS_TIMEOUT)
+    except subprocess.TimeoutExpired as e:
+        logger.info("KWin window info timed out: %s", e)
+        return None
     win_info_dataclass = _to_dataclass(win_info)
     if win_info_dataclass:
         pid = _run_kdotool(["getwindowpid", win_id])
@@ -184,8 +202,9 @@ def get_window_info(win_id: str) -> WindowsWindow | None:
     return None
 
 
-def get_all_windows(own_win_id: str | None = None, ignored_windows: list | None = None) -> dict:
+def get_all_windows(own_win_id: str | None = None, ignored_windows: frozenset | None = None) -> dict:
     """Get the title from all existing windows."""
+    ignored_windows = ignored_windows or frozenset()
     win_ids = _run_kdotool(["search", "."])
     if not win_ids:
         return {}
@@ -202,7 +221,7 @@ def get_all_windows(own_win_id: str | None = None, ignored_windows: list | None
                 continue
 
             title = clean_window_title(win_info.title, titlecase=True)[0]
-            x = re.search(r"(.+)v\d+", title, re.IGNORECASE)
+            x = TITLE_VERSION_PATTERN.search(title)
             if x:
                 title = x.group(1).strip()
 
@@ -229,22 +248,51 @@ def set_window_frame(win_id: str, enable: bool = True) -> str | bool:  # noqa: F
 
 
 @_validate_win_id
-def set_size(win_id: str, win_info: WindowsWindow, width: int, height: int) -> None:  # noqa: D103
+def set_size(win_id: str, width: int, height: int) -> None:  # noqa: D103
     _run_kdotool(["windowsize"], win_id, str(width), str(height))
 
 
 @_validate_win_id
-def set_position(win_id: str, win_info: WindowsWindow, x: int, y: int) -> None:  # noqa: D103
+def set_position(win_id: str, x: int, y: int) -> None:  # noqa: D103
     _run_kdotool(["windowmove"], win_id, str(x), str(y))
 
 
+@_validate_win_id
+def set_rect(win_id: str, x: int, y: int, width: int, height: int) -> None:
+    """Move and resize a window."""
+    _run_kdotool(["windowmove"], win_id, str(x), str(y))
+    _run_kdotool(["windowsize"], win_id, str(width), str(height))
+
+
+def _is_main_window(win_id: str) -> bool:
+    """Check if a win_id is the main window of this application, not one of its dialogs."""
+    return _run_kdotool(["getwindowname"], win_id) == get_app_window_title()
+
+
+def _get_own_window_id() -> str | None:
+    """Get the main window id of this application, searching kdotool by pid only when the cached id is stale."""
+    global _own_window_id  # noqa: PLW0603
+    if _own_window_id and _is_main_window(_own_window_id):
+        return _own_window_id
+
+    _own_window_id = None
+    # The search lists every window of the process, e.g. an open dialog or message box next to the main window
+    found = _run_kdotool(["search", "--pid", str(os.getpid()), "--all"])
+    for win_id in str(found or "").split():
+        if _is_main_window(win_id):
+            _own_window_id = win_id
+            break
+    return _own_window_id
+
+
 def bring_to_front(win_id: str, is_self: bool = False) -> None:
     """Set a window to the front, not AOT."""
     if is_self:
-        pid = os.getpid()
-        cmd = ["search", "--pid", str(pid), "--all"]
-        win_id = _run_kdotool(cmd)
-    if is_valid_window(win_id):
+        win_id = _get_own_window_id()
+        valid = win_id is not None
+    else:
+        valid = is_valid_window(win_id)
+    if valid:
         _run_kdotool(["windowraise"], win_id)
     else:
         logger.warning("Can't %s for invalid window: %s", "bring_to_front", win_id)
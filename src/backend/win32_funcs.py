@@ -7,7 +7,6 @@ from collections.abc import Callable
 from pathlib import Path
 
 import global_hotkeys
-import hdrcapture
 import psutil
 import win32api
 import win32gui
@@ -30,7 +29,12 @@ from win32con import (
     WS_THICKFRAME,
 )
 
-from backend.common import WindowsWindow, clean_window_title
+from backend.common import (
+    TITLE_VERSION_PATTERN,
+    WindowsWindow,
+    clean_window_title,
+    process_details,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +99,9 @@ def run_clean_subprocess(
 @_validate_hwnd
 def get_screenshot(hwnd: int, path: Path) -> None:
     """Take a screenshot of the window using hdrcapture."""
+    # Loaded on first capture, most sessions never take a screenshot
+    import hdrcapture  # noqa: PLC0415
+
     with hdrcapture.capture.window(hwnd=hwnd) as cap:
         frame = cap.capture()
         frame.save(str(path))
@@ -134,9 +141,7 @@ def get_window_info(hwnd: int) -> WindowsWindow | None:
     titlebar = style & WS_CAPTION != 0
 
     try:
-        proc = psutil.Process(pid)
-        app_name = proc.name()
-        app_path = proc.exe()
+        app_name, app_path = process_details(psutil.Process(pid))
 
     except (psutil.NoSuchProcess, psutil.AccessDenied):
         app_name = ""
@@ -157,8 +162,9 @@ def get_window_info(hwnd: int) -> WindowsWindow | None:
     )
 
 
-def get_all_windows(own_hwnd: int | None = None, ignored_windows: list | None = None) -> dict:
+def get_all_windows(own_hwnd: int | None = None, ignored_windows: frozenset | None = None) -> dict:
     """Get the title from all existing windows."""
+    ignored_windows = ignored_windows or frozenset()
     max_length = 50
     def enum_window_callback(hwnd: int, windows: list) -> bool:
         if win32gui.IsWindowVisible(hwnd) and hwnd != own_hwnd:
@@ -167,7 +173,7 @@ def get_all_windows(own_hwnd: int | None = None, ignored_windows: list | None =
                 return True
 
             title = clean_window_title(win_info.title, titlecase=True)[0]
-            x = re.search(r"(.+)v\d+", title, re.IGNORECASE)
+            x = TITLE_VERSION_PATTERN.search(title)
             if x:
                 title = x.group(1).strip()
 
@@ -195,12 +201,13 @@ def set_aot(hwnd: int, enable: bool = True) -> None:  # noqa: FBT001, FBT002
 @_validate_hwnd
 def set_window_frame(hwnd: int, enable: bool = True) -> bool:  # noqa: FBT001, FBT002
     """Restore the titlebar and window frame for a window."""
-    style = win32gui.GetWindowLong(hwnd, GWL_STYLE)
+    current_style = win32gui.GetWindowLong(hwnd, GWL_STYLE)
     style_changes = (WS_CAPTION | WS_BORDER | WS_THICKFRAME)
-    if enable:
-        style |= style_changes
-    else:
-        style &= ~style_changes
+    style = current_style | style_changes if enable else current_style & ~style_changes
+
+    # Already in the requested state, skip the frame change and non-client repaint
+    if style == current_style:
+        return True
 
     win32gui.SetWindowLong(hwnd, GWL_STYLE, style)
     win32gui.SetWindowPos(hwnd, 0, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE |
@@ -209,21 +216,29 @@ def set_window_frame(hwnd: int, enable: bool = True) -> bool:  # noqa: FBT001, F
 
 
 @_validate_hwnd
-def set_size(hwnd: int, win_info: WindowsWindow, width: int, height: int) -> None:  # noqa: D103
-    x, y = int(win_info.x), int(win_info.y)
-    win32gui.SetWindowPos(hwnd, 0, x, y, width, height, SWP_NOZORDER | SWP_NOMOVE)
+def set_size(hwnd: int, width: int, height: int) -> None:  # noqa: D103
+    win32gui.SetWindowPos(hwnd, 0, 0, 0, width, height, SWP_NOZORDER | SWP_NOMOVE)
+
+
+@_validate_hwnd
+def set_position(hwnd: int, x: int, y: int) -> None:  # noqa: D103
+    win32gui.SetWindowPos(hwnd, 0, x, y, 0, 0, SWP_NOZORDER | SWP_NOSIZE)
 
 
 @_validate_hwnd
-def set_position(hwnd: int, win_info: WindowsWindow, x: int, y: int) -> None:  # noqa: D103
-    width, height = win_info.width, win_info.height
-    win32gui.SetWindowPos(hwnd, 0, x, y, width, height, SWP_NOZORDER | SWP_NOSIZE)
+def set_rect(hwnd: int, x: int, y: int, width: int, height: int) -> None:
+    """Move and resize a window in a single call."""
+    win32gui.SetWindowPos(hwnd, 0, x, y, width, height, SWP_NOZORDER)
 
 
 @_validate_hwnd
 def bring_to_front(hwnd: int, is_self: bool = False) -> None:
     """Set a window to the front, not AOT."""
     win32gui.ShowWindow(hwnd, SW_RESTORE)
+    # Already in front and not AOT, the topmost toggle would only cause extra Z-order broadcasts
+    if (win32gui.GetForegroundWindow() == hwnd
+            and not win32gui.GetWindowLong(hwnd, GWL_EXSTYLE) & WS_EX_TOPMOST):
+        return
     win32gui.SetWindowPos(hwnd, HWND_TOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
     win32gui.SetWindowPos(hwnd, HWND_NOTOPMOST, 0, 0, 0, 0, SWP_NOMOVE | SWP_NOSIZE)
 
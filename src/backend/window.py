@@ -4,7 +4,8 @@ import threading
 import time
 from collections.abc import Callable
 from configparser import ConfigParser
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from functools import lru_cache
 
 # Local imports
 from backend import (
@@ -14,12 +15,14 @@ from backend import (
     is_valid_window,
     set_aot,
     set_position,
+    set_rect,
     set_size,
     set_window_frame,
 )
 from backend.common import (
     WindowInfo,
     WindowMetrics,
+    config_metrics_snapshot,
     config_to_metrics,
     match_titles,
     metrics_to_window_info,
@@ -31,6 +34,28 @@ logger = logging.getLogger(__name__)
 MIN_W = 250
 MIN_H = 250
 
+APPLY_STEPS = frozenset({"titlebar", "pos", "size", "aot"})
+
+
+@lru_cache(maxsize=32)
+def parse_apply_order(apply_order: str) -> tuple[str, ...]:
+    """Parse a comma separated apply order into steps.
+
+    Adjacent pos and size steps are merged into a single rect step that moves and resizes at once.
+    """
+    steps = []
+    for raw_key in apply_order.split(","):
+        key = raw_key.strip().lower()
+        if key not in APPLY_STEPS:
+            if key:
+                logger.warning("Ignoring unknown apply order step: %s", raw_key)
+            continue
+        if steps and {steps[-1], key} == {"pos", "size"}:
+            steps[-1] = "rect"
+        else:
+            steps.append(key)
+    return tuple(steps)
+
 
 @dataclass
 class WindowCache:
@@ -49,7 +74,7 @@ class WindowCache:
             if self._is_valid():
                 return self._data
             self._data = fetch_func()
-            self.timestamp = time.time()
+            self.timestamp = time.monotonic()
             return self._data
 
     def invalidate(self) -> None:
@@ -60,7 +85,7 @@ class WindowCache:
 
     def _is_valid(self) -> bool:
         """Check if the cache is still fresh."""
-        return self._data is not None and (time.time() - self.timestamp) < self.ttl
+        return self._data is not None and (time.monotonic() - self.timestamp) < self.ttl
 
 
 class WindowManager:
@@ -73,14 +98,15 @@ class WindowManager:
         self.managed_windows = {}
         self.default_apply_order = ["titlebar", "pos", "size", "aot"]
         self.window_cache = WindowCache(ttl=1.0)
-        self.valid_titles_cache = WindowCache(ttl=1.0)
         self.all_windows = None
-        self.ignored_windows = []
+        self.ignored_windows = frozenset()
+        self._match_cache = {}
+        self._match_cache_windows = None
+        self._match_lock = threading.Lock()
 
     def refresh_window_cache(self) -> None:
         """Manually invalidate caches and refresh window list."""
-        self.window_cache = None
-        self.valid_titles_cache = None
+        self.window_cache.invalidate()
         self.update_window_list()
 
     def update_window_list(self) -> None:
@@ -92,34 +118,29 @@ class WindowManager:
         if not is_valid_window(win_id):
             return
 
-        # Apply settings
-        apply_funcs = {
-            "aot": (self.set_always_on_top, settings.aot),
-            "titlebar": (set_window_frame, settings.border),
-            "pos": (self.set_window_position, settings.x, settings.y),
-            "size": (self.set_window_size, settings.w, settings.h),
-        }
-
-        apply_order = self.default_apply_order
-        apply_order_str = settings.apply_order
-        if apply_order_str:
-            apply_order = apply_order_str.split(",")
+        apply_order = settings.apply_order or ",".join(self.default_apply_order)
 
         bring_to_front(win_id)
-        for raw_key in apply_order:
-            key = raw_key.strip().lower()
-            args = apply_funcs[key][1:]
-            if args:
-                apply_funcs[key][0](win_id, *args)
+        for step in parse_apply_order(apply_order):
+            if step == "rect":
+                self.set_window_rect(win_id, settings.x, settings.y, settings.w, settings.h)
+            elif step == "pos":
+                self.set_window_position(win_id, settings.x, settings.y)
+            elif step == "size":
+                self.set_window_size(win_id, settings.w, settings.h)
+            elif step == "titlebar":
+                set_window_frame(win_id, settings.border)
+            elif step == "aot":
+                self.set_always_on_top(win_id, settings.aot)
 
         logger.info("Applied config to %s: %s", win_id, settings)
 
     # Apply window config helper functions
-    def add_managed_window(self, win_id: int) -> bool:
-        """Add a window to the managed windows list."""
+    def add_managed_window(self, win_id: int, metrics: WindowMetrics | None = None) -> bool:
+        """Add a window to the managed windows list, optionally with metrics that were just read."""
         if win_id not in self.managed_windows:
             # Store initial window state
-            metrics = self.get_window_metrics(win_id)
+            metrics = metrics or self.get_window_metrics(win_id)
             if not metrics:
                 logger.error("Failed to get metrics for %s", win_id)
                 return False
@@ -153,13 +174,13 @@ class WindowManager:
                 size_w = original_state.w
                 size_h = original_state.h
 
-                self.set_window_position(win_id, pos_x, pos_y)
-                logger.info("Restored position for %s: (%s, %s)", win_id, pos_x, pos_y)
-
                 if size_w > MIN_W and size_h > MIN_H:
-                    self.set_window_size(win_id, size_w, size_h)
+                    self.set_window_rect(win_id, pos_x, pos_y, size_w, size_h)
+                    logger.info("Restored position for %s: (%s, %s)", win_id, pos_x, pos_y)
                     logger.info("Restored size for %s: (%s, %s)", win_id, size_w, size_h)
                 else:
+                    self.set_window_position(win_id, pos_x, pos_y)
+                    logger.info("Restored position for %s: (%s, %s)", win_id, pos_x, pos_y)
                     logger.info("Original size for %s is below minimum,"
                                 "skipping size restore: (%s, %s)", win_id, size_w, size_h)
 
@@ -205,7 +226,8 @@ class WindowManager:
             issues_found = True
 
         # Check all windows are still valid
-        invalid_managed = [win_id for win_id in self.managed_windows if not is_valid_window(win_id)]
+        # Iterate a snapshot, workers can add managed windows while the validity checks run
+        invalid_managed = [win_id for win_id in tuple(self.managed_windows) if not is_valid_window(win_id)]
         if invalid_managed:
             logger.warning("Removing %s invalid managed window(s)", len(invalid_managed))
             for win_id in invalid_managed:
@@ -223,33 +245,47 @@ class WindowManager:
         if not sections:
             return [], []
 
-        def _get_valid_titles() -> dict:
-            valid_titles_dict = {}
-            self.update_window_list()
-            for title in self.all_windows:
-                valid_titles_dict[title] = self.all_windows[title].app_name
-            return valid_titles_dict
+        # The window list is shared through the window cache, so a new dict means a new enumeration
+        self.update_window_list()
+        windows = self.all_windows
+        key = (id(config), tuple(ignore))
+        # Called from the GUI thread and the workers, swap and fill the cache as one step
+        with self._match_lock:
+            if windows is not self._match_cache_windows:
+                self._match_cache = {}
+                self._match_cache_windows = windows
+
+            cached = self._match_cache.get(key)
+            if cached is None or cached[0] is not config:
+                cached = (config, *self._match_windows(config, sections, ignore, windows))
+                self._match_cache[key] = cached
+
+        _, matching_windows, missing_windows = cached
+        return list(matching_windows), list(missing_windows)
 
-        valid_titles = self.valid_titles_cache.get(_get_valid_titles)
+    @staticmethod
+    def _match_windows(config: ConfigParser, sections: list, ignore: list,
+                       windows: dict) -> tuple[list[dict], list[str]]:
+        """Match config sections against the enumerated windows."""
+        valid_titles = list(windows)
 
         if ignore:
-            titles = match_titles(ignore, list(valid_titles.keys()), get_titles=True)
-            for item in titles:
-                valid_titles.pop(item, None)
+            ignored_titles = set(match_titles(ignore, valid_titles, get_titles=True).values())
+            valid_titles = [title for title in valid_titles if title not in ignored_titles]
 
-        title_matches = match_titles(sections, list(valid_titles.keys()), get_titles=True)
+        title_matches = match_titles(sections, valid_titles, get_titles=True)
         missing_windows = list(set(sections) - set(title_matches.keys()))
         matching_windows = []
 
         for section, title in title_matches.items():
-            window_info = self.all_windows.get(title)
+            window_info = windows[title]
             config_exe = config.get(section, "exe", fallback=None)
             if not config_exe or window_info.app_name.lower() == config_exe.lower():
                 matching_windows.append({
-                    "name": self.all_windows[title].title,
+                    "name": window_info.title,
                     "short_name": title,
-                    "win_id": self.all_windows[title].win_id,
-                    "exe": self.all_windows[title].app_name,
+                    "win_id": window_info.win_id,
+                    "exe": window_info.app_name,
                     "aot": config.getboolean(section, "always_on_top", fallback=False),
                 })
             else:
@@ -304,7 +340,8 @@ class WindowManager:
             return None
 
 
-    def verify_window_data(self, config: ConfigParser, matching_windows: list) -> list:
+    def verify_window_data(self, config: ConfigParser, matching_windows: list,
+                           snapshot: dict[str, WindowMetrics] | None = None) -> list:
         """Compare the metrics of the windows in the config with the actual windows and return a list of results."""
         compare_results = []
         for match in matching_windows:
@@ -314,15 +351,15 @@ class WindowManager:
                 continue
 
             section = match["short_name"]
-            settings_metrics = config_to_metrics(config, section)
-
-            win_met = {k: v for k, v in asdict(metrics).items() if k != "apply_order"}
-            cfg_met = {k: v for k, v in asdict(settings_metrics).items() if k != "apply_order"}
+            settings_metrics = snapshot.get(section) if snapshot else None
+            if settings_metrics is None:
+                settings_metrics = config_to_metrics(config, section)
 
             results["name"] = match["name"]
             results["win_id"] = match["win_id"]
             results["short_name"] = match["short_name"]
-            results["identical"] = win_met == cfg_met
+            results["metrics"] = metrics
+            results["identical"] = metrics.placement() == settings_metrics.placement()
             compare_results.append(results)
 
         return compare_results
@@ -349,7 +386,7 @@ class WindowManager:
 
     def toggle_always_on_top(self, own_win_id: int | str) -> None:
         """Toggle AOT status for current config."""
-        for win_id in self.topmost_windows:
+        for win_id in tuple(self.topmost_windows):
             info = get_window_info(win_id)
             if info:
                 logger.info("Toggling AOT for %s: currently %s", win_id, "Yes" if info.aot else "No")
@@ -360,20 +397,11 @@ class WindowManager:
     @staticmethod
     def get_windows_for_layout(config: ConfigParser, missing_windows: list) -> list[WindowInfo]:
         """Get the windows from the config to use for drawing the layout preview."""
-        positioned_windows = []
-        if not config:
-            return []
-
-        for section in config.sections():
-            metrics = config_to_metrics(config, section)
-            if not metrics:
-                continue
-
-            exists = section not in missing_windows
-            window_info = metrics_to_window_info(section, metrics, exists=exists)
-            positioned_windows.append(window_info)
-
-        return positioned_windows
+        missing = set(missing_windows)
+        return [
+            metrics_to_window_info(section, metrics, exists=section not in missing)
+            for section, metrics in config_metrics_snapshot(config).items()
+        ]
 
     # Set functions
     @staticmethod
@@ -392,19 +420,14 @@ class WindowManager:
     @staticmethod
     def set_window_size(win_id: int | str, width: int, height: int) -> bool | None:
         """Set the size of the window."""
-        win_info = get_window_info(win_id)
-        if win_info:
-            set_size(win_id, win_info, width, height)
-            return True
+        return set_size(win_id, width, height) is not False
 
-        return False
+    @staticmethod
+    def set_window_rect(win_id: int | str, x: int, y: int, width: int, height: int) -> None:
+        """Set the position and size of the window."""
+        set_rect(win_id, x, y, width, height)
 
     @staticmethod
     def set_window_position(win_id: int | str, x: int, y: int) -> bool | None:
         """Set the position of the window."""
-        win_info = get_window_info(win_id)
-        if win_info:
-            set_position(win_id, win_info, x, y)
-            return True
-
-        return False
+        return set_position(win_id, x, y) is not False
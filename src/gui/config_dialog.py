@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from fractions import Fraction
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QSize, Qt, QTimer
@@ -26,9 +25,10 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from backend import ConfigManager, WindowInfo, clean_window_title, to_bool, validate_int_pair
+from backend import WindowInfo, clean_window_title, to_bool, validate_int_pair
 from backend.config import ApplicationSettings
 from backend.constants import Fonts, UIConstants
+from backend.layout import ScreenArea, compute_positions, layout_weight
 from gui.layout_preview import ScreenLayoutWidget
 
 if TYPE_CHECKING:
@@ -76,7 +76,7 @@ class ConfigDialog(QDialog):
         super().__init__(parent)
         self.hide()
         self.app_settings = parent.settings
-        self.err_msg = QMessageBox(self)
+        self.err_msg = None
         self.lower_switch = None
         self.upper_switch = None
         self.save_area = QWidget()
@@ -87,6 +87,7 @@ class ConfigDialog(QDialog):
         self.layout_container = None
         self.ratio_label = None
         self.ignore_edit = None
+        self.apply_order_list = None
         self.row_to_title = None
         self.settings_rows = None
         self.rows_layout = None
@@ -95,16 +96,15 @@ class ConfigDialog(QDialog):
 
         self.colors = parent.colors
         self.use_images = True
-        self.cfg_man = ConfigManager(parent.base_path)
+        self.cfg_man = parent.cfg_man
         self.win_man = parent.win_man
         self.config_name = config_name
         self.scale = scale
 
-        self.auto_align_offsets = None
-
         self.window_titles = window_titles
         self.save_callback = save_callback
         self.settings_callback = settings_callback
+        self._window_settings = {}
         self.refresh_callback = refresh_callback
         self.screen_width = screen_width
         self.screen_height_org = screen_height
@@ -114,8 +114,7 @@ class ConfigDialog(QDialog):
         self.assets_dir = assets_dir
         self.max_windows = max_windows
 
-        self.layout_number = 0
-        self.layout_preview = None
+        self._setup_layout_state()
 
         self.main_layout = QVBoxLayout(self)
 
@@ -136,9 +135,23 @@ class ConfigDialog(QDialog):
         QTimer.singleShot(0, self._open_selection_menu)
 
 
+    def _setup_layout_state(self) -> None:
+        """Initialize auto-align state and the preview redraw timer."""
+        self.auto_align_offsets = None
+        self._layouts = None
+        self.layout_number = 0
+        self.layout_preview = None
+
+        # Coalesce back-to-back auto-align and row moves into a single preview redraw
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(80)
+        self._redraw_timer.timeout.connect(self.update_layout_frame)
+
+
     def _get_apply_order(self) -> list[str]:
         """Retrieve and validate the current apply order from config."""
-        settings = self.settings_callback("DEFAULT")
+        settings = self._get_window_settings("DEFAULT")
 
         valid_labels = self.win_man.default_apply_order
         valid_labels = [label.title() for label in valid_labels if label]
@@ -161,14 +174,32 @@ class ConfigDialog(QDialog):
 
         return apply_order
 
+    def _show_error(self, text: str) -> None:
+        """Show an error message box, creating it the first time it is needed."""
+        if self.err_msg is None:
+            self.err_msg = QMessageBox(self)
+            self.err_msg.setStandardButtons(QMessageBox.StandardButton.Ok)
+        self.err_msg.setText(text)
+        self.err_msg.show()
+
+    def _get_window_settings(self, title: str) -> dict:
+        """Get the settings for a window title, collected once per dialog."""
+        if title not in self._window_settings:
+            self._window_settings[title] = self.settings_callback(title) or {}
+        return self._window_settings[title]
+
+    def _get_layouts(self) -> tuple[dict, dict]:
+        """Get auto-align layouts and offsets, loaded from settings once per dialog."""
+        if self._layouts is None:
+            self._layouts = self.cfg_man.load_or_create_layouts()
+        return self._layouts
+
     def confirm_selection(self) -> None:
         """Validate selected windows and move to settings stage."""
         selected = [t for t, cb in self.switches.items() if cb.isChecked()]
 
         if not selected:
-            self.err_msg.setText("ERROR:\nNo windows selected!")
-            self.err_msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            self.err_msg.show()
+            self._show_error("ERROR:\nNo windows selected!")
             return
         if len(selected) > self.max_windows:
             QMessageBox.critical(
@@ -187,7 +218,7 @@ class ConfigDialog(QDialog):
         """Sort windows by their X position from settings."""
         def get_x_pos(title: str) -> int:
             if self.settings_rows is None:
-                pos_str = (self.settings_callback(title) or {}).get("position", "0,0")
+                pos_str = self._get_window_settings(title).get("position", "0,0")
             else:
                 pos_str = self.settings_rows[title].get_values()["position"]
             x_str = pos_str.split(",")[0]
@@ -217,6 +248,7 @@ class ConfigDialog(QDialog):
             item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
             item.setSizeHint(QSize(110, 20))
             listw.addItem(item)
+        self.apply_order_list = listw
 
         listw.setStyleSheet(f"""
         QListWidget::item {{
@@ -300,11 +332,20 @@ class ConfigDialog(QDialog):
         else:
             self.screen_height = self.screen_height_org
 
-    def show_config_settings(self, windows: list[str] | None = None) -> None:  # noqa: PLR0915
+    def show_config_settings(self, windows: list[str] | None = None) -> None:
         """Display settings rows, controls, and layout preview for selected windows."""
         if windows:
             self.sorted_windows = windows
 
+        # Build all rows and controls without intermediate repaints, shown in one pass at the end
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_config_settings()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _build_config_settings(self) -> None:  # noqa: PLR0915
+        """Create the settings rows, controls, layout preview and save area."""
         settings_layout = QVBoxLayout(self.settings_area)
         self.settings_area.layout().addWidget(self.name_header)
 
@@ -321,7 +362,7 @@ class ConfigDialog(QDialog):
         self.row_to_title = {}
 
         for title in self.sorted_windows:
-            values = self.settings_callback(title) or {}
+            values = self._get_window_settings(title)
             row = WindowSettingsRow(title, values)
             self.add_move_buttons(row)
             self.rows_layout.addWidget(row)
@@ -329,7 +370,7 @@ class ConfigDialog(QDialog):
             self.row_to_title[row] = title
 
         settings_layout.addWidget(rows_container, stretch=0)
-        ignore_list = self.settings_callback("DEFAULT").get("ignore_list", "") if self.edit_mode else ""
+        ignore_list = self._get_window_settings("DEFAULT").get("ignore_list", "") if self.edit_mode else ""
         ignore_label = QLabel("List of titles to not match (comma separated):")
 
         self.ignore_edit = QLineEdit(ignore_list)
@@ -392,9 +433,15 @@ class ConfigDialog(QDialog):
 
         self.layout().addWidget(self.settings_area)
 
-        self.resize(self.sizeHint())
-        window_min_height = UIConstants.WINDOW_MIN_HEIGHT + (len(self.settings_rows) * 50)
-        self.setMinimumSize(UIConstants.WINDOW_MIN_WIDTH, window_min_height)
+        # Add the preview before sizing so the dialog is laid out once with all of its content
+        self.update_layout_frame()
+
+        window_min_size = QSize(
+            UIConstants.WINDOW_MIN_WIDTH,
+            UIConstants.WINDOW_MIN_HEIGHT + (len(self.settings_rows) * 50),
+        )
+        self.resize(self.sizeHint().expandedTo(window_min_size))
+        self.setMinimumSize(window_min_size)
 
         if self.parent():
             p_geo = self.parent().geometry()
@@ -403,7 +450,6 @@ class ConfigDialog(QDialog):
                 p_geo.y(),
             )
 
-        self.update_layout_frame()
         self._update_config_name()
 
 
@@ -509,7 +555,7 @@ class ConfigDialog(QDialog):
         self.sorted_windows = list(self.settings_rows.keys())
         self.sorted_windows = self._sort_windows_by_position(self.sorted_windows)
 
-        self.update_layout_frame()
+        self.schedule_layout_update()
         self._update_config_name()
 
 
@@ -526,12 +572,17 @@ class ConfigDialog(QDialog):
                                       ))
         return windows
 
+    def schedule_layout_update(self) -> None:
+        """Redraw the layout preview once repeated auto-align or move clicks have settled."""
+        self._redraw_timer.start()
+
     def update_layout_frame(self) -> None:
         """Update the layout preview."""
         windows = self.gather_windows()
 
         if self.layout_preview:
-            self.layout_preview.setParent(None)
+            self.layout_preview.set_windows(windows)
+            return
 
         self.layout_preview = ScreenLayoutWidget(
             self, self.screen_width, self.screen_height_org,
@@ -561,95 +612,6 @@ class ConfigDialog(QDialog):
         )
 
 
-    def _calc_four(self, layout_configs: list,
-                   screen_width: int, screen_height: int, usable_height: int,
-                   ) -> list[tuple]:
-        _ = screen_height
-        layout = layout_configs[self.layout_number]
-        positions = []
-        for (rel_x, rel_y), (rel_w, rel_h) in layout:
-            raw_x = int(rel_x * screen_width)
-            raw_y = int(rel_y * usable_height) + self.y_offset
-            raw_w = int(rel_w * screen_width)
-            raw_h = int(rel_h * usable_height)
-            positions.append((raw_x, raw_y, raw_w, raw_h))
-        return positions
-
-
-    def _calc_three(self, layout_configs: list,
-                   screen_width: int, screen_height: int, usable_height: int,
-                   ) -> list[tuple]:
-        numerator, denominator, weight_1 = layout_configs[self.layout_number]
-        weight_1 = Fraction(weight_1)
-        if not (0 <= weight_1 <= 1):
-            weight_1 = Fraction(1, 2)
-
-        weight_2 = 1 - weight_1
-        ratio = Fraction(numerator, denominator)
-
-        aux_width = screen_width - (screen_height * ratio)
-        left_width = aux_width * weight_1
-        center_width = screen_height * ratio
-        right_width = aux_width * weight_2
-
-        return [
-            (0, self.y_offset, left_width, usable_height),
-            (left_width, self.y_offset, center_width, screen_height),
-            (left_width + center_width, self.y_offset, right_width, usable_height),
-        ]
-
-
-    def _calc_two(self, layout_configs: list,
-                  screen_width: int, screen_height: int, usable_height: int,
-                  ) -> list[tuple]:
-        numerator, denominator, side = layout_configs[self.layout_number]
-        ratio = Fraction(numerator, denominator)
-
-        config = {
-            "R": ("Right", screen_height * ratio, 1, screen_height, screen_height),
-            "L": ("Left", screen_height * ratio, 0, screen_height, screen_height),
-            "CL": ("Center Left", screen_height * ratio, 1, usable_height, screen_height),
-            "CR": ("Center Right", screen_height * ratio, 0, screen_height, usable_height),
-        }
-
-        side_text, side_width, aot, left_height, right_height = config.get(side, ("", 0, 0, 0, 0))
-
-        if side in ("R", "CL"):
-            right_width = side_width
-            left_width = (screen_width - right_width) / (2 if side == "CL" else 1)
-            left_x = 0
-        else:
-            left_width = side_width
-            right_width = (screen_width - left_width) / (2 if side == "CR" else 1)
-            left_x = right_width if side == "CR" else 0
-
-        right_x = left_x + left_width
-        return [
-            (int(left_x), self.y_offset, int(left_width), int(left_height)),
-            (int(right_x), self.y_offset, int(right_width), int(right_height)),
-        ]
-
-
-    def _calc_one(self, layout_configs: list,
-                  screen_width: int, screen_height: int, usable_height: int,
-                  ) -> list[tuple]:
-        _usable_height = usable_height
-        numerator, denominator, side = layout_configs[self.layout_number]
-        ratio = Fraction(numerator, denominator)
-
-        raw_x = 0
-        window_width = screen_height * ratio
-
-        if side == "R":
-            raw_x = screen_width - window_width
-        elif side == "L":
-            raw_x = 0
-        elif side == "C":
-            raw_x = (screen_width / 2) - (window_width / 2)
-
-        return [(int(raw_x), self.y_offset, int(window_width), int(screen_height))]
-
-
     def _get_layout_info(self, num_windows: int, layout_configs: list) -> dict:
         config_layout = layout_configs[self.layout_number]
 
@@ -664,7 +626,7 @@ class ConfigDialog(QDialog):
             }
         if num_windows == 3:  # noqa: PLR2004
             numerator, denominator, weight_1 = config_layout
-            weight_1 = Fraction(weight_1)
+            weight_1 = layout_weight(weight_1)
             weight_2 = 1 - weight_1
             return {
                 "name_func": lambda: clean_window_title(
@@ -735,8 +697,7 @@ class ConfigDialog(QDialog):
 
     def auto_position(self, sorted_windows: list[str]) -> None:
         """Automatically set window configuration based on presets."""
-        loaded_layouts, def_offsets = self.cfg_man.load_or_create_layouts()
-        def_layouts = dict(loaded_layouts)
+        def_layouts, def_offsets = self._get_layouts()
         self.auto_align_offsets = def_offsets
         screen_width = self.screen_width
         screen_height = self.screen_height - self.y_offset
@@ -758,23 +719,17 @@ class ConfigDialog(QDialog):
         layout_max = len(layout_configs) - 1
         self.preset_label_text = f"Preset {self.layout_number + 1}/{layout_max + 1}\t"
 
-        pos_calculators = {
-            1: self._calc_one,
-            2: self._calc_two,
-            3: self._calc_three,
-            4: self._calc_four,
-            }
-
-        if num_windows in pos_calculators:
-            try:
-                positions = pos_calculators[num_windows](layout_configs, screen_width, screen_height, usable_height)
+        try:
+            area = ScreenArea(screen_width, screen_height, usable_height, self.y_offset)
+            positions = compute_positions(num_windows, layout_configs[self.layout_number], area)
+            if positions is not None:
                 self._apply_layout(positions, sorted_windows, num_windows, layout_configs)
-            except TypeError as e:
-                logger.info("Error calculating layout, possible invalid settings file: %s", e)
+        except TypeError as e:
+            logger.info("Error calculating layout, possible invalid settings file: %s", e)
 
 
         self.layout_number = 0 if self.layout_number >= layout_max else self.layout_number + 1
-        self.update_layout_frame()
+        self.schedule_layout_update()
 
 
     def _calculate_offsets(self, x: int, y: int, w: int, h: int, title: str) -> tuple[int, int, int, int, str]:
@@ -795,21 +750,17 @@ class ConfigDialog(QDialog):
         config_data = { title: row.get_values() for title, row in self.settings_rows.items() }
         name = self.config_name_edit.text().strip()
         if not name:
-            self.err_msg.setText("ERROR:\nConfig name is required!")
-            self.err_msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            self.err_msg.show()
+            self._show_error("ERROR:\nConfig name is required!")
             return
 
         if name.lower() == "no configs found":
-            self.err_msg.setText("ERROR:\nInvalid config name!")
-            self.err_msg.setStandardButtons(QMessageBox.StandardButton.Ok)
-            self.err_msg.show()
+            self._show_error("ERROR:\nInvalid config name!")
             return
 
         apply_order = self.apply_order or []
-        apply_order_widget = self.layout_container.findChild(QListWidget)
-        if apply_order_widget:
-            apply_order = [ apply_order_widget.item(i).text() for i in range(apply_order_widget.count()) ]
+        listw = self.apply_order_list
+        if listw:
+            apply_order = [ listw.item(i).text() for i in range(listw.count()) ]
 
         ignore_list = self.ignore_edit.text().strip().split(",") or []
 
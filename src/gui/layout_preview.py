@@ -3,22 +3,42 @@
 from __future__ import annotations
 
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QRect, Qt
-from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap, QWheelEvent
+from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter, QPen, QPixmap, QResizeEvent, QWheelEvent
 from PySide6.QtWidgets import QLabel, QWidget
 
-from backend import WindowInfo, convert_hex_to_rgb
-from backend.constants import Colors
+from backend import WindowInfo, asset_name, convert_hex_to_rgb
+from backend.constants import ASSET_RATIOS, Colors
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from backend.config import ApplicationSettings
 
 logger = logging.getLogger(__name__)
 
+text_title = QFont("Arial", 10)
+text_detail = QFont("Arial", 8)
+
+
+@lru_cache(maxsize=64)
+def _load_pixmap(path: str) -> QPixmap:
+    """Load and decode an image file once."""
+    return QPixmap(path)
+
+
+@lru_cache(maxsize=128)
+def _load_scaled_pixmap(path: str, width: int, height: int) -> QPixmap:
+    """Get an image scaled to the given size, scaling each size only once."""
+    return _load_pixmap(path).scaled(
+        width, height,
+        Qt.AspectRatioMode.IgnoreAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
 
 class ScreenLayoutWidget(QWidget):
     """Layout preview widget."""
@@ -37,7 +57,6 @@ class ScreenLayoutWidget(QWidget):
         self.last_y_offset = None
         self.last_x_offset = None
         self.last_scale = None
-        self.active_labels = None
         self.parent = parent
         self.colors = self.parent.colors
         self.assets_dir = assets_dir
@@ -55,6 +74,72 @@ class ScreenLayoutWidget(QWidget):
         self.line_height = 16
 
         self.status_labels = {}
+        self._geometry_cache = None
+        self._asset_index = None
+        self._image_candidates = {}
+        self._render_cache = None
+
+        # Re-render once a resize has settled, until then the last render is stretched
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self.update)
+
+    def set_windows(self, windows: list[WindowInfo]) -> None:
+        """Replace the previewed windows, dropping status labels of windows no longer shown."""
+        self.windows = windows
+        names = {win.name for win in windows}
+        for name in [name for name in self.status_labels if name not in names]:
+            self.status_labels.pop(name).deleteLater()
+        self.update()
+
+    def reload_assets(self) -> None:
+        """Drop the asset index and decoded images so the image folder is read again on the next paint."""
+        self._asset_index = None
+        self._image_candidates = {}
+        self._render_cache = None
+        _load_pixmap.cache_clear()
+        _load_scaled_pixmap.cache_clear()
+
+    def _assets_mtime_ns(self) -> int | None:
+        """Get the modification time of the image folder, None if it does not exist."""
+        try:
+            return self.assets_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_asset_index(self) -> dict[str, Path]:
+        """Get a lowercase file name to path index of the png files, rescanning only when the folder changed."""
+        mtime_ns = self._assets_mtime_ns()
+        if self._asset_index and self._asset_index[0] == mtime_ns:
+            return self._asset_index[1]
+
+        # Images added or removed outside the app, e.g. through the image folder button
+        self._image_candidates = {}
+        _load_pixmap.cache_clear()
+        _load_scaled_pixmap.cache_clear()
+        try:
+            with os.scandir(self.assets_dir) as entries:
+                index = {
+                    entry.name.lower(): Path(entry.path) for entry in entries
+                    if entry.is_file() and entry.name.lower().endswith(".png")
+                }
+        except OSError:
+            index = {}
+        self._asset_index = (mtime_ns, index)
+        return index
+
+    def _get_image_candidates(self, name: str) -> list[tuple[Path, float]]:
+        """Get the screenshots and their aspect ratios for a window, resolved once per name and folder state."""
+        index = self._get_asset_index()
+        if name not in self._image_candidates:
+            prefix = asset_name(name).lower()
+            self._image_candidates[name] = [
+                (img_path, ASSET_RATIOS.get(img_path.stem.split("_")[-1], 1.0))
+                for file_name, img_path in index.items()
+                if file_name.startswith(prefix)
+            ]
+        return self._image_candidates[name]
 
     def _handle_status_label(self, win: WindowInfo, x: int, y: int, w: int, h: int) -> None:
         _y = y
@@ -79,29 +164,62 @@ class ScreenLayoutWidget(QWidget):
         else:
             label.hide()
 
+    def _render_key(self) -> tuple:
+        """Get the state the rendered preview depends on."""
+        return (
+            self.width(),
+            self.height(),
+            self.devicePixelRatioF(),
+            self.use_images,
+            self._assets_mtime_ns() if self.use_images else None,
+            self.window_details,
+            self.colors.BACKGROUND,
+            tuple(
+                (win.name, win.pos_x, win.pos_y, win.width, win.height, win.always_on_top, win.exists)
+                for win in self.windows
+            ),
+        )
+
+    def resizeEvent(self, event: QResizeEvent) -> None:  # noqa: N802
+        """Override for resizeEvent."""
+        self._resize_timer.start()
+        super().resizeEvent(event)
+
     def paintEvent(self, event: None) -> None:  # noqa: N802
         """Override for paintEvent."""
         _event = event
+        if self._resize_timer.isActive() and self._render_cache is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self.rect(), self._render_cache[1])
+            return
+
+        key = self._render_key()
+        if self._render_cache is None or self._render_cache[0] != key:
+            # Render into a backing pixmap, repaints with unchanged state only blit it
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            buffer_painter = QPainter(pixmap)
+            self.draw_layout(buffer_painter, self.width(), self.height())
+            buffer_painter.end()
+            self._render_cache = (key, pixmap)
+
         painter = QPainter(self)
-        self.draw_layout(painter, self.width(), self.height())
+        painter.drawPixmap(0, 0, self._render_cache[1])
 
     def wheelEvent(self, event: QWheelEvent) -> None:  # noqa: N802
         """Override for wheelEvent."""
-        if hasattr(self.parent, "combo_box"):
-            combo = self.parent.combo_box
-            delta = event.angleDelta().y()
-            current = combo.currentIndex()
-            new_index = max(0, current - 1) if delta > 0 else min(combo.count() - 1, current + 1)
-            combo.setCurrentIndex(new_index)
+        if hasattr(self.parent, "step_config_selection"):
+            self.parent.step_config_selection(event.angleDelta().y())
 
-    def draw_layout(self, painter: QPainter, width: int, height: int) -> None:
-        """Draw the layout preview."""
-        self.active_labels = set()
-        for win in self.windows:
-            win_name = win.name
-            self.active_labels.add(win_name)
+    def _get_frame_geometry(self, width: int, height: int) -> tuple[float, float, float, QRect, QRect]:
+        """Get scale, offsets, frame and taskbar rects for the given size.
 
-        painter.fillRect(0, 0, width, height, QColor(self.colors.BACKGROUND))
+        The result only depends on the widget size, so it is cached until the size changes.
+        """
+        key = (width, height)
+        if self._geometry_cache and self._geometry_cache[0] == key:
+            return self._geometry_cache[1]
 
         frame_width = 15 // self.scale
         padding = frame_width / 2
@@ -114,53 +232,68 @@ class ScreenLayoutWidget(QWidget):
 
         if canvas_ratio > screen_ratio:
             scale = drawable_height / self.screen_height
-            scaled_width = scale * self.screen_width
+        else:
+            scale = drawable_width / self.screen_width
+
+        scaled_width = scale * self.screen_width
+        scaled_height = scale * self.screen_height
+        scaled_taskbar = self.taskbar_height * scale
+
+        if canvas_ratio > screen_ratio:
             x_offset = (drawable_width - scaled_width) / 2 + frame_width
             y_offset = frame_width
         else:
-            scale = drawable_width / self.screen_width
-            scaled_height = scale * self.screen_height
             x_offset = frame_width
             y_offset = (drawable_height - scaled_height) / 2 + frame_width
 
-        self.last_scale = scale
-        self.last_x_offset = x_offset
-        self.last_y_offset = y_offset
-
         frame_rect = QRect(
             int(x_offset - padding),
             int(y_offset - padding),
-            int(scale * self.screen_width + padding * 2),
-            int(scale * self.screen_height + padding * 2),
+            int(scaled_width + padding * 2),
+            int(scaled_height + padding * 2),
         )
 
+        taskbar_rect = QRect(
+            int(frame_rect.left() + padding),
+            int(frame_rect.bottom() - padding - scaled_taskbar),
+            int(frame_rect.width() - padding * 2),
+            int(scaled_taskbar),
+        )
+
+        geometry = (scale, x_offset, y_offset, frame_rect, taskbar_rect)
+        self._geometry_cache = (key, geometry)
+        return geometry
+
+    def draw_layout(self, painter: QPainter, width: int, height: int) -> None:
+        """Draw the layout preview."""
+        painter.fillRect(0, 0, width, height, QColor(self.colors.BACKGROUND))
+
+        frame_width = 15 // self.scale
+        scale, x_offset, y_offset, frame_rect, taskbar_rect = self._get_frame_geometry(width, height)
+
+        self.last_scale = scale
+        self.last_x_offset = x_offset
+        self.last_y_offset = y_offset
+
         # Fill inner screen area
         painter.fillRect(frame_rect, QColor("#202020"))
         painter.setPen(QColor(Colors.WINDOW_BORDER))
         painter.drawRect(frame_rect)
 
         # Windows
-        aot_windows = [w for w in self.windows if w.always_on_top]
-        regular_windows = [w for w in self.windows if not w.always_on_top]
+        aot_windows = []
+        regular_windows = []
+        for win in self.windows:
+            (aot_windows if win.always_on_top else regular_windows).append(win)
 
         for win in regular_windows:
-            self.draw_window(painter, x_offset, y_offset, win, scale)
+            self.draw_window(painter, x_offset, y_offset, win, scale, frame_rect)
 
         # Taskbar
-        taskbar_rect = QRect(
-            int(frame_rect.left() + padding),
-            int(frame_rect.bottom() - padding - self.taskbar_height * scale),
-            int(frame_rect.width() - padding * 2),
-            int(self.taskbar_height * scale),
-        )
         painter.fillRect(taskbar_rect, QColor(Colors.TASKBAR))
 
         for win in aot_windows:
-            self.draw_window(painter, x_offset, y_offset, win, scale)
-
-        for title, label in list(self.status_labels.items()):
-            if title not in self.active_labels:
-                label.hide()
+            self.draw_window(painter, x_offset, y_offset, win, scale, frame_rect)
 
         # Outer border drawn last
         r, g, b = convert_hex_to_rgb(Colors.WINDOW_FRAME)
@@ -171,12 +304,13 @@ class ScreenLayoutWidget(QWidget):
         corner_radius = 10 // self.scale
         painter.drawRoundedRect(frame_rect, corner_radius, corner_radius)
 
-    def draw_window(self,
+    def draw_window(self,  # noqa: PLR0913
                     painter: QPainter,
                     x_offset: int,
                     y_offset: int,
                     win: WindowInfo,
                     scale: float,
+                    frame_rect: QRect,
                     ) -> None:
         """Draw a window representation."""
         x = int(x_offset + win.pos_x * scale)
@@ -184,6 +318,13 @@ class ScreenLayoutWidget(QWidget):
         w = int(win.width * scale)
         h = int(win.height * scale)
 
+        # Windows placed entirely off screen would not be visible inside the frame
+        if not frame_rect.intersects(QRect(x, y, w, h)):
+            label = self.status_labels.get(win.name)
+            if label:
+                label.hide()
+            return
+
         draw_params = {"painter": painter, "x": x, "y": y, "w": w, "h": h, "win": win}
 
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, on=False)
@@ -234,7 +375,7 @@ class ScreenLayoutWidget(QWidget):
         for i, line in enumerate(info_lines):
             if not line:
                 continue
-            painter.setFont(QFont("Arial", 10 if i == 0 else 8))
+            painter.setFont(text_title if i == 0 else text_detail)
 
             metrics = painter.fontMetrics()
             text_rect = metrics.boundingRect(line)
@@ -265,36 +406,10 @@ class ScreenLayoutWidget(QWidget):
         painter = draw_params["painter"]
         x, y, w, h = draw_params["x"], draw_params["y"], draw_params["w"], draw_params["h"]
         target_ratio = w / h
-        base_name = win.name.replace(" ", "_").replace(":", "")
-
-        ratios = {
-            "32-9": 32/9,
-            "21-9": 21/9,
-            "16-9": 16/9,
-            "4-3": 4/3,
-            "square": 1,
-            "3-4": 3/4,
-            "9-16": 9/16,
-            "9-21": 9/21,
-            "9-32": 9/32,
-        }
-
-        best_path = None
-        min_diff = float("inf")
-
-        for img_path in self.assets_dir.glob(f"{base_name}*.png"):
-            suffix = img_path.stem.split("_")[-1]
-            file_ratio = ratios.get(suffix, 1.0)
-
-            diff = abs(target_ratio - file_ratio)
-            if diff < min_diff:
-                min_diff = diff
-                best_path = img_path
-
-        if best_path and best_path.exists():
-            pixmap = QPixmap(str(best_path)).scaled(
-                int(w), int(h),
-                Qt.AspectRatioMode.IgnoreAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
+
+        candidates = self._get_image_candidates(win.name)
+        best_path = min(candidates, key=lambda c: abs(target_ratio - c[1]))[0] if candidates else None
+
+        if best_path:
+            pixmap = _load_scaled_pixmap(str(best_path), int(w), int(h))
             painter.drawPixmap(int(x), int(y), pixmap)
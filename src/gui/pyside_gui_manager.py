@@ -6,11 +6,12 @@ import logging
 import sys
 import time
 from configparser import ConfigParser
+from html import escape
 from math import ceil
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QRect, QSize, Qt, QThreadPool, QTimer
-from PySide6.QtGui import QFont, QIcon, QImage, QWheelEvent
+from PySide6.QtCore import QEvent, QObject, QRect, QSignalBlocker, QSize, Qt, QThreadPool, QTimer
+from PySide6.QtGui import QFont, QIcon, QImageReader, QWheelEvent
 from PySide6.QtWidgets import (
     QApplication,
     QBoxLayout,
@@ -29,6 +30,7 @@ from PySide6.QtWidgets import (
 )
 
 from backend import (
+    asset_name,
     bring_to_front,
     get_aot_toggle,
     get_app_window_title,
@@ -36,8 +38,8 @@ from backend import (
     run_clean_subprocess,
 )
 from backend.common import (
+    config_metrics_snapshot,
     get_data_path,
-    invert_hex_color,
 )
 from backend.config import (
     ConfigManager,
@@ -48,7 +50,7 @@ from backend.config import (
 )
 
 # Local imports
-from backend.constants import Colors, Fonts, Messages, UIConstants
+from backend.constants import ASSET_RATIO_SUFFIXES, Colors, Fonts, Messages, UIConstants
 from backend.window import (
     WindowInfo,
     WindowManager,
@@ -94,7 +96,9 @@ class PysideGuiManager(QMainWindow):
         self.config_files = None
         self.config_active = False
         self.applied_config = None
+        self.applied_metrics = {}
         self.applied_config_name = None
+        self._reapply_label_state = None
         self.last_applied_config = None
 
         self.style_dark = True
@@ -105,6 +109,9 @@ class PysideGuiManager(QMainWindow):
 
         self.managed_label = None
         self.managed_text = None
+        self._style_sheet = None
+        self._compact_hidden = ()
+        self._compact_resized = ()
 
         self.ui_constants = UIConstants()
         self.colors = Colors()
@@ -115,8 +122,7 @@ class PysideGuiManager(QMainWindow):
         self.valid_res_override = self.cfg_man.validate_screen_res_override(self.settings.screen_resolution_override)
         self.res_override_used = self.settings.screen_resolution_override != ""
 
-        low_ignore_list = [item.lower() for item in self.settings.ignored_windows]
-        self.win_man.ignored_windows = low_ignore_list
+        self.win_man.ignored_windows = frozenset(item.lower() for item in self.settings.ignored_windows)
 
         self._init_screen()
 
@@ -177,8 +183,9 @@ class PysideGuiManager(QMainWindow):
     def _setup_ui(self) -> None:
         """Build the UI, apply theme, connect callbacks."""
         self._build_ui()
+        self._collect_compact_elements()
+        # toggle_compact also applies the theme
         self.toggle_compact(startup=True)
-        self._apply_theme()
         self._connect_callbacks()
 
     def _apply_snap_selection(self) -> None:
@@ -194,16 +201,19 @@ class PysideGuiManager(QMainWindow):
 
     def eventFilter(self, source: QObject, event: QWheelEvent) -> bool:  # noqa: N802
         """Catch mouse wheel events on managed windows widget."""
-        if source is self.managed_widget and event.type() == QWheelEvent:
-            combo = self.combo_box
-            delta = event.angleDelta().y()
-            current = combo.currentIndex()
-            new_index = max(0, current - 1) if delta > 0 else min(combo.count() - 1, current + 1)
-            combo.setCurrentIndex(new_index)
-
+        if source is self.managed_widget and event.type() == QEvent.Type.Wheel:
+            self.step_config_selection(event.angleDelta().y())
             return True
         return super().eventFilter(source, event)
 
+    def step_config_selection(self, delta: int) -> None:
+        """Select the previous or next config depending on the wheel direction."""
+        combo = self.combo_box
+        current = combo.currentIndex()
+        new_index = max(0, current - 1) if delta > 0 else min(combo.count() - 1, current + 1)
+        if new_index != current:
+            combo.setCurrentIndex(new_index)
+
     def get_geometry_and_minsize(self) -> tuple[int, int, int, int]:
         """Get the sizes needed to set geometry and minsize."""
         compact_height_factor = 1
@@ -220,9 +230,9 @@ class PysideGuiManager(QMainWindow):
 
         return width, height, min_width, min_height
 
-    def toggle_elements(self, *, compact: bool, min_width: int) -> None:
-        """Hide or show elements for compact/full mode."""
-        hidden_elements = [
+    def _collect_compact_elements(self) -> None:
+        """Collect the widgets affected by compact mode once after the UI is built."""
+        self._compact_hidden = (
             self.layout_frame,
             self.theme_switch,
             self.filter_switch,
@@ -238,9 +248,9 @@ class PysideGuiManager(QMainWindow):
             self.center_radio,
             self.right_radio,
             self.snap_label,
-        ]
+        )
 
-        resized_buttons = [
+        self._compact_resized = (
             self.apply_config_button,
             self.create_config_button,
             self.delete_config_button,
@@ -249,24 +259,19 @@ class PysideGuiManager(QMainWindow):
             self.edit_config_button,
             self.image_folder_button,
             self.screenshot_button,
-        ]
+        )
 
+    def toggle_elements(self, *, compact: bool, min_width: int) -> None:
+        """Hide or show elements for compact/full mode."""
         self.managed_widget.setVisible(compact)
 
-        if compact:
-            for button in resized_buttons:
-                button.setFixedHeight(self.ui_constants.COMPACT_BUTTON_HEIGHT)
-            self.combo_box.setFixedWidth(min_width - 20)
-        else:
-            for button in resized_buttons:
-                button.setFixedHeight(self.ui_constants.BUTTON_HEIGHT)
-            self.combo_box.setFixedWidth(int(min_width / 2))
+        button_height = self.ui_constants.COMPACT_BUTTON_HEIGHT if compact else self.ui_constants.BUTTON_HEIGHT
+        for button in self._compact_resized:
+            button.setFixedHeight(button_height)
+        self.combo_box.setFixedWidth(min_width - 20 if compact else int(min_width / 2))
 
-        for widget in hidden_elements:
-            if compact:
-                widget.hide()
-            else:
-                widget.show()
+        for widget in self._compact_hidden:
+            widget.setVisible(not compact)
 
         if compact:
             self.b1.setDirection(QBoxLayout.Direction.TopToBottom)
@@ -277,20 +282,18 @@ class PysideGuiManager(QMainWindow):
 
     def update_managed_text(self, lines: list, aot_flags: list, missing: list) -> None:
         """Update the text for the managed windows view (for compact mode)."""
-        self.managed_text.setReadOnly(False)
-        self.managed_text.clear()
-
-        for i, line in enumerate(lines):
-            if aot_flags[i]:
-                self.managed_text.setTextColor(self.colors.TEXT_ALWAYS_ON_TOP)
+        html_lines = []
+        for line, is_aot, is_missing in zip(lines, aot_flags, missing, strict=False):
+            if is_missing:
+                color = "#777777"
+            elif is_aot:
+                color = self.colors.TEXT_ALWAYS_ON_TOP
             else:
-                self.managed_text.setTextColor(self.colors.TEXT_NORMAL)
-
-            if missing[i]:
-                self.managed_text.setTextColor("#777777")
-
-            self.managed_text.append(line)
+                color = self.colors.TEXT_NORMAL
+            html_lines.append(f'<div style="color: {color}">{escape(line)}</div>')
 
+        # Set the whole document at once instead of one append (and relayout) per line
+        self.managed_text.setHtml("".join(html_lines))
         self.managed_text.setReadOnly(True)
 
     # Build GUI
@@ -471,17 +474,21 @@ class PysideGuiManager(QMainWindow):
 
     def update_reapply_label(self) -> None:
         """Update the text and color of the reapply status label."""
-        reapply_txt = "Reapply "
         if self.reapply_paused:
-            reapply_txt += "PAUSED"
-            self.reapply_pause_label.setStyleSheet(f"color: {self.colors.TEXT_NOTICE}")
+            state = ("PAUSED", self.colors.TEXT_NOTICE)
         elif self.reapply and self.config_active:
-            reapply_txt += "ACTIVE"
-            self.reapply_pause_label.setStyleSheet(f"color: {self.colors.TEXT_ALWAYS_ON_TOP}")
+            state = ("ACTIVE", self.colors.TEXT_ALWAYS_ON_TOP)
         else:
-            reapply_txt += "INACTIVE"
-            self.reapply_pause_label.setStyleSheet(f"color: {self.colors.TEXT_NORMAL}")
-        self.reapply_pause_label.setText(reapply_txt)
+            state = ("INACTIVE", self.colors.TEXT_NORMAL)
+
+        # Called on every reapply tick, so only restyle the label when the state changes
+        if state == self._reapply_label_state:
+            return
+        self._reapply_label_state = state
+
+        status, color = state
+        self.reapply_pause_label.setStyleSheet(f"color: {color}")
+        self.reapply_pause_label.setText(f"Reapply {status}")
 
     def _build_images_and_snap_row(self) -> None:
         """Create checkboxes for auto re-apply, details, images, and snap selection."""
@@ -561,7 +568,7 @@ class PysideGuiManager(QMainWindow):
             font_size = int(font_size / self.res_scale / 0.75)
             button_font_size = int(button_font_size / self.res_scale / 0.75)
 
-        self.setStyleSheet(f"""
+        style_sheet = f"""
             QWidget {{
                 background: {self.colors.BACKGROUND};
                 color: {self.colors.TEXT_NORMAL};
@@ -650,9 +657,14 @@ class PysideGuiManager(QMainWindow):
                 width: 18px;
                 height: 18px;
             }}
-        """)
-        self.spacer_1.setStyleSheet(f"background:{self.colors.BACKGROUND}; border: none")
-        self.spacer_2.setStyleSheet(f"background:{self.colors.BACKGROUND}; border: none")
+        """
+
+        # Setting a style sheet re-polishes every child widget, skip it when nothing changed
+        if style_sheet != self._style_sheet:
+            self._style_sheet = style_sheet
+            self.setStyleSheet(style_sheet)
+            self.spacer_1.setStyleSheet(f"background:{self.colors.BACKGROUND}; border: none")
+            self.spacer_2.setStyleSheet(f"background:{self.colors.BACKGROUND}; border: none")
 
         # Re-apply dynamic states after theme reset
         self.format_apply_button(selected_config_shortname=None)
@@ -692,12 +704,10 @@ class PysideGuiManager(QMainWindow):
             self.info_label.setText("")
 
     def invert_colors(self) -> None:
-        """Invert all colors in the color list."""
-        for attr in dir(self.colors):
-            if attr.isupper():
-                value = getattr(self.colors, attr)
-                if isinstance(value, str):
-                    setattr(self.colors, attr, invert_hex_color(value))
+        """Switch to the precomputed color set of the current theme."""
+        self.colors = Colors() if self.style_dark else Colors.inverted()
+        if self.layout_frame:
+            self.layout_frame.colors = self.colors
 
     def _save_settings(self) -> None:
         """Save GUI settings."""
@@ -715,8 +725,7 @@ class PysideGuiManager(QMainWindow):
 
     def set_layout_frame(self, windows: list[WindowInfo]) -> None:
         """Layout frame population."""
-        self.layout_frame.windows = windows
-        self.layout_frame.update()
+        self.layout_frame.set_windows(windows)
 
     def update_config_list(self, config: str | None = None) -> None:
         """Get new config list from disk."""
@@ -737,11 +746,13 @@ class PysideGuiManager(QMainWindow):
             self.on_config_select()
 
     def set_combo_values(self, values: list, current: str) -> None:
-        """Update the values for the combobox."""
-        self.combo_box.clear()
-        self.combo_box.addItems(values)
-        if current:
-            self.combo_box.setCurrentText(current)
+        """Update the values for the combobox without triggering a config select per intermediate index."""
+        # clear, addItems and setCurrentText each emit currentIndexChanged, callers select once afterwards
+        with QSignalBlocker(self.combo_box):
+            self.combo_box.clear()
+            self.combo_box.addItems(values)
+            if current:
+                self.combo_box.setCurrentText(current)
 
     def update_window_layout(self, config: ConfigParser, missing_windows: list) -> None:
         """Update the layout."""
@@ -772,8 +783,7 @@ class PysideGuiManager(QMainWindow):
 
     def capture_window(self, window: dict) -> None:
         """Take a screenshot of the window using hdrcapture and Qt for processing."""
-        self.assets_dir.mkdir(parents=True, exist_ok=True)
-        name = window["short_name"].replace(" ", "_").replace(":", "")
+        name = asset_name(window["short_name"])
         save_path = Path(self.assets_dir / f"{name}.png")
         max_size = QSize(1024, 1024)
 
@@ -788,29 +798,23 @@ class PysideGuiManager(QMainWindow):
             msg = f"File {save_path} could not be saved."
             raise FileNotFoundError(msg)
 
-        img = QImage(str(save_path))
-        if not img.isNull():
-            img.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Size the decode from the header so oversized captures are scaled while reading,
+        # formats with native scaled decoding skip the full resolution pass entirely
+        reader = QImageReader(str(save_path))
+        source_size = reader.size()
+        if source_size.width() > max_size.width() or source_size.height() > max_size.height():
+            reader.setScaledSize(source_size.scaled(max_size, Qt.AspectRatioMode.KeepAspectRatio))
 
+        img = reader.read()
+        if not img.isNull():
             ratio = img.width() / img.height()
 
-            ratio_suffixes = [
-                (3.0, "32-9"),
-                (2.0, "21-9"),
-                (1.5, "16-9"),
-                (1.2, "4-3"),
-                (0.85, "square"),
-                (0.65, "3-4"),
-                (0.5, "9-16"),
-                (0.35, "9-21"),
-                (0.28, "9-32"),
-            ]
-
-            suffix = next((s for threshold, s in ratio_suffixes if ratio > threshold), "9-32")
+            suffix = next((s for threshold, s in ASSET_RATIO_SUFFIXES if ratio > threshold), "9-32")
 
             save_path = self.assets_dir / f"{name}_{suffix}.png"
+            # Qt maps PNG quality to zlib effort, 60 is a fast level with close to default file size
             # noinspection PyTypeChecker
-            img.save(str(save_path), "PNG")
+            img.save(str(save_path), "PNG", 60)
         else:
             logger.error("Failed to create QImage from mss buffer for %s", name)
 
@@ -913,7 +917,8 @@ class PysideGuiManager(QMainWindow):
             shortname = self.toggle_active_config(cfg)
             self.applied_config_name = shortname
 
-        worker = ApplyWorker(win_man=self.win_man, config=self.applied_config)
+        worker = ApplyWorker(win_man=self.win_man, config=self.applied_config,
+                             snapshot=self.applied_metrics)
         worker.signals.finished.connect(self._on_apply_finished)
 
         self.thread_pool.start(worker)
@@ -942,11 +947,17 @@ class PysideGuiManager(QMainWindow):
             self.detect_config_button.setText("Predict config")
 
         width, height, min_width, min_height = self.get_geometry_and_minsize()
-        self.toggle_elements(compact=self.settings.compact, min_width=min_width)
-        self.setMinimumSize(min_width, min_height)
-        self._position_app_window()
-        self.on_config_select()
-        self._apply_theme()
+
+        # Batch the show/hide and resize storm into a single layout and repaint pass
+        self.setUpdatesEnabled(False)
+        try:
+            self.toggle_elements(compact=self.settings.compact, min_width=min_width)
+            self.setMinimumSize(min_width, min_height)
+            self._position_app_window()
+            self.on_config_select()
+            self._apply_theme()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def _position_app_window(self) -> None:
         width, height, _, _ = self.get_geometry_and_minsize()
@@ -1012,6 +1023,7 @@ class PysideGuiManager(QMainWindow):
         self._save_settings()
         if self.layout_frame:
             self.layout_frame.use_images = self.settings.use_images
+            self.layout_frame.reload_assets()
             self.layout_frame.update()
 
     # Radio button actions
@@ -1054,7 +1066,8 @@ class PysideGuiManager(QMainWindow):
         """Change the status label text to reflect current number of AOT windows."""
         count = None
 
-        aot_windows = self.win_man.topmost_windows
+        # Snapshot, a running worker may add topmost windows while the count is taken
+        aot_windows = tuple(self.win_man.topmost_windows)
         if aot_windows:
             count = 0
             for win_id in aot_windows:
@@ -1110,7 +1123,7 @@ class PysideGuiManager(QMainWindow):
 
         self.reapply_in_progress = True
 
-        worker = ReapplyWorker(self.win_man, self.applied_config)
+        worker = ReapplyWorker(self.win_man, self.applied_config, self.applied_metrics)
         worker.signals.finished.connect(self._on_reapply_finished)
         self.thread_pool.start(worker)
 
@@ -1142,11 +1155,14 @@ class PysideGuiManager(QMainWindow):
         self.screenshot_in_progress = True
         self.reapply_paused = True
 
-        apply_worker = ApplyWorker(win_man=self.win_man, config=self.config)
+        # Captures do not need the windows raised, so placed windows keep their Z-order
+        apply_worker = ApplyWorker(win_man=self.win_man, config=self.config, raise_placed=False)
         apply_worker.signals.finished.connect(self._take_screenshot)
         self.thread_pool.start(apply_worker)
 
     def _take_screenshot(self) -> None:
+        # Created once per batch, capture_window assumes the folder exists
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
         screenshot_worker = ScreenshotWorker(
             win_man=self.win_man,
             config=self.config,
@@ -1161,6 +1177,7 @@ class PysideGuiManager(QMainWindow):
         bring_to_front(self.winId(), is_self=True)
 
         self.info_label.setText("Screenshot taken for all detected windows.")
+        self.layout_frame.reload_assets()
         _, missing = self.get_matching_and_missing_windows(self.config)
         self.update_window_layout(self.config, missing)
 
@@ -1179,6 +1196,7 @@ class PysideGuiManager(QMainWindow):
         if self.config_active:
             file = self.config_files[cfg_name]
             self.applied_config = self.cfg_man.load_config(file)
+            self.applied_metrics = config_metrics_snapshot(self.applied_config)
 
             logger.info("Applied config: %s", cfg_name)
             logger.info("Managed windows: %s\n", self.win_man.managed_windows)
@@ -1186,6 +1204,7 @@ class PysideGuiManager(QMainWindow):
             return cfg_name
 
         self.applied_config = None
+        self.applied_metrics = {}
         self.win_man.reset_all_windows()
 
         logger.info("Config cleared.")
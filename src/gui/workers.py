@@ -6,12 +6,15 @@ from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, QRunnable, Signal
 
-from backend.common import config_to_metrics
+from backend import bring_to_front
+from backend.common import config_metrics_snapshot
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from configparser import ConfigParser
 
+    from backend.common import WindowMetrics
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -46,10 +49,13 @@ class GenericWorker(QRunnable):
 class ApplyWorker(GenericWorker):
     """Worker for applying window configurations."""
 
-    def __init__(self, win_man: object, config: ConfigParser) -> None:
+    def __init__(self, win_man: object, config: ConfigParser,
+                 snapshot: dict[str, WindowMetrics] | None = None, *, raise_placed: bool = True) -> None:
         """Initialize the worker."""
         self.win_man = win_man
         self.config = config
+        self.snapshot = snapshot if snapshot is not None else config_metrics_snapshot(config)
+        self.raise_placed = raise_placed
         super().__init__(self.apply_settings)
 
     def apply_settings(self) -> None:
@@ -61,12 +67,21 @@ class ApplyWorker(GenericWorker):
 
             for window in matching_windows:
                 win_id = window["win_id"]
-                self.win_man.add_managed_window(win_id)
+                # One metrics read serves both the initial state and the already-in-place check
+                current = self.win_man.get_window_metrics(win_id)
+                self.win_man.add_managed_window(win_id, current)
 
-                settings = config_to_metrics(self.config, window["short_name"])
+                settings = self.snapshot.get(window["short_name"])
                 if settings:
                     if settings.aot:
                         self.win_man.topmost_windows.add(win_id)
+
+                    # Windows already in place are only raised, as apply_window_config would, not moved again
+                    if current and current.placement() == settings.placement():
+                        logger.info("Settings already in place for %s", window["name"])
+                        if self.raise_placed:
+                            bring_to_front(win_id)
+                        continue
                     self.win_man.apply_window_config(settings, win_id)
                 else:
                     logger.info("Failed to apply settings to %s", window)
@@ -75,10 +90,12 @@ class ApplyWorker(GenericWorker):
 class ReapplyWorker(GenericWorker):
     """Worker for reapplying window configurations."""
 
-    def __init__(self, win_man: object, config: ConfigParser) -> None:
+    def __init__(self, win_man: object, config: ConfigParser,
+                 snapshot: dict[str, WindowMetrics] | None = None) -> None:
         """Initialize the worker."""
         self.win_man = win_man
         self.config = config
+        self.snapshot = snapshot if snapshot is not None else config_metrics_snapshot(config)
         super().__init__(self._reapply_settings_logic)
 
     def _reapply_settings_logic(self) -> None:
@@ -86,15 +103,15 @@ class ReapplyWorker(GenericWorker):
         self.win_man.validate_state()
         matching, _ = self.win_man.find_matching_windows(self.config, [])
         if matching:
-            win_match_config = self.win_man.verify_window_data(self.config, matching)
+            win_match_config = self.win_man.verify_window_data(self.config, matching, self.snapshot)
             for win in win_match_config:
                 if not win["identical"]:
                     logger.info("Reapply triggered on %s", win["name"])
 
                     if win["win_id"] not in self.win_man.managed_windows:
-                        self.win_man.add_managed_window(win["win_id"])
+                        self.win_man.add_managed_window(win["win_id"], win["metrics"])
 
-                    settings = config_to_metrics(self.config, win["short_name"])
+                    settings = self.snapshot.get(win["short_name"])
                     if settings:
                         if settings.aot:
                             self.win_man.topmost_windows.add(win["win_id"])